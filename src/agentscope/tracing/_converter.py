@@ -1,12 +1,22 @@
 # -*- coding: utf-8 -*-
 """Convert ContentBlock to OpenTelemetry GenAI part format."""
 
+from types import MappingProxyType
 from typing import Any, Dict
 
 from ..message import ContentBlock
 
 from ._utils import _serialize_to_str
 
+# The media types used for base64 sources without a media type
+_DEFAULT_MEDIA_TYPES = MappingProxyType(
+    {
+        "image": "image/jpeg",
+        "audio": "audio/wav",
+        "video": "video/mp4",
+    },
+)
+
 
 def _convert_media_block(
     source: Dict[str, Any],
@@ -38,12 +48,7 @@ def _convert_media_block(
         data = source.get("data", "")
         media_type = source.get("media_type")
         if not media_type:
-            default_media_types = {
-                "image": "image/jpeg",
-                "audio": "audio/wav",
-                "video": "video/mp4",
-            }
-            media_type = default_media_types.get(modality, "unknown")
+            media_type = _DEFAULT_MEDIA_TYPES.get(modality, "unknown")
         return {
             "type": "blob",
             "content": data,
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Extract attributes from AgentScope components for OpenTelemetry tracing."""
 import inspect
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict, Tuple, TYPE_CHECKING
 
 from .. import _config
@@ -27,18 +29,20 @@ else:
     FormatterBase = "FormatterBase"
     Toolkit = "Toolkit"
 
-_CLASS_NAME_MAP = {
-    "dashscope": ProviderNameValues.DASHSCOPE,
-    "openai": ProviderNameValues.OPENAI,
-    "anthropic": ProviderNameValues.ANTHROPIC,
-    "gemini": ProviderNameValues.GCP_GEMINI,
-    "ollama": ProviderNameValues.OLLAMA,
-    "deepseek": ProviderNameValues.DEEPSEEK,
-    "trinity": ProviderNameValues.OPENAI,
-}
+_CLASS_NAME_MAP = MappingProxyType(
+    {
+        "dashscope": ProviderNameValues.DASHSCOPE,
+        "openai": ProviderNameValues.OPENAI,
+        "anthropic": ProviderNameValues.ANTHROPIC,
+        "gemini": ProviderNameValues.GCP_GEMINI,
+        "ollama": ProviderNameValues.OLLAMA,
+        "deepseek": ProviderNameValues.DEEPSEEK,
+        "trinity": ProviderNameValues.OPENAI,
+    },
+)
 
 # Map base URL fragments to provider names for OpenAI-compatible APIs
-_BASE_URL_PROVIDER_MAP = [
+_BASE_URL_PROVIDER_MAP = (
     ("api.openai.com", ProviderNameValues.OPENAI),
     ("dashscope", ProviderNameValues.DASHSCOPE),
     ("deepseek", ProviderNameValues.DEEPSEEK),
@@ -46,7 +50,7 @@ _BASE_URL_PROVIDER_MAP = [
     ("generativelanguage.googleapis.com", ProviderNameValues.GCP_GEMINI),
     ("openai.azure.com", ProviderNameValues.AZURE_AI_OPENAI),
     ("amazonaws.com", ProviderNameValues.AWS_BEDROCK),
-]
+)
 
 
 def _get_common_attributes() -> Dict[str, str]:
@@ -63,6 +67,30 @@ def _get_common_attributes() -> Dict[str, str]:
     }
 
 
+@lru_cache(maxsize=1024)
+def _get_name_from_class_name(classname: str, *suffixes: str) -> str:
+    """Map an AgentScope class name to a provider name.
+
+    The result only depends on the class name, so it's cached to avoid
+    repeating the string processing for every span.
+
+    Args:
+        classname (`str`):
+            The class name, e.g. "OpenAIChatFormatter".
+        *suffixes (`str`):
+            The suffixes to remove from the class name in order, e.g.
+            "ChatFormatter" and "MultiAgentFormatter".
+
+    Returns:
+        `str`:
+            Provider name (e.g., "openai", "dashscope", "anthropic"), or
+            "unknown" if the class name is not recognized.
+    """
+    for suffix in suffixes:
+        classname = classname.removesuffix(suffix)
+    return _CLASS_NAME_MAP.get(classname.lower(), "unknown")
+
+
 def _get_format_target(instance: Any) -> str:
     """Get format target for the given instance.
 
@@ -76,13 +104,11 @@ def _get_format_target(instance: Any) -> str:
         `str`:
             Format target name (e.g., "openai", "dashscope", "anthropic")
     """
-    classname = instance.__class__.__name__
-    prefix_key = (
-        classname.removesuffix("ChatFormatter")
-        .removesuffix("MultiAgentFormatter")
-        .lower()
+    return _get_name_from_class_name(
+        instance.__class__.__name__,
+        "ChatFormatter",
+        "MultiAgentFormatter",
     )
-    return _CLASS_NAME_MAP.get(prefix_key, "unknown")
 
 
 def _get_provider_name(instance: ChatModelBase) -> str:
@@ -125,12 +151,11 @@ def _get_provider_name(instance: ChatModelBase) -> str:
         return ProviderNameValues.OPENAI
 
     # For other model types, use direct mapping
-    prefix_key = (
-        classname.removesuffix("ChatModel")
-        .removesuffix("MultiAgentModel")
-        .lower()
+    return _get_name_from_class_name(
+        classname,
+        "ChatModel",
+        "MultiAgentModel",
     )
-    return _CLASS_NAME_MAP.get(prefix_key, "unknown")
 
 
 def _get_tool_definitions(
@@ -177,14 +202,16 @@ def _get_tool_definitions(
                 continue
 
             func_def = tool["function"]
-            flat_tool = {
-                "type": tool.get("type", "function"),
-                "name": func_def.get("name"),
-                "description": func_def.get("description"),
-                "parameters": func_def.get("parameters"),
-            }
-            # Remove None values
-            flat_tool = {k: v for k, v in flat_tool.items() if v is not None}
+            flat_tool = {}
+            # Skip None values
+            for key, value in (
+                ("type", tool.get("type", "function")),
+                ("name", func_def.get("name")),
+                ("description", func_def.get("description")),
+                ("parameters", func_def.get("parameters")),
+            ):
+                if value is not None:
+                    flat_tool[key] = value
             flat_tools.append(flat_tool)
 
         if flat_tools:
@@ -221,32 +248,15 @@ def _get_llm_request_attributes(
             tool definitions, and custom AgentScope function input.
     """
 
+    # Use an explicit None check so that a zero `p` isn't overridden
+    top_p = kwargs.get("p")
+    if top_p is None:
+        top_p = kwargs.get("top_p")
+
     attributes = {
         # required attributes
         SpanAttributes.GEN_AI_OPERATION_NAME: OperationNameValues.CHAT,
         SpanAttributes.GEN_AI_PROVIDER_NAME: _get_provider_name(instance),
-        # conditionally required attributes
-        SpanAttributes.GEN_AI_REQUEST_MODEL: getattr(
-            instance,
-            "model_name",
-            "unknown_model",
-        ),
-        # recommended attributes
-        SpanAttributes.GEN_AI_REQUEST_TEMPERATURE: kwargs.get("temperature"),
-        SpanAttributes.GEN_AI_REQUEST_TOP_P: kwargs.get("p")
-        or kwargs.get("top_p"),
-        SpanAttributes.GEN_AI_REQUEST_TOP_K: kwargs.get("top_k"),
-        SpanAttributes.GEN_AI_REQUEST_MAX_TOKENS: kwargs.get("max_tokens"),
-        SpanAttributes.GEN_AI_REQUEST_PRESENCE_PENALTY: kwargs.get(
-            "presence_penalty",
-        ),
-        SpanAttributes.GEN_AI_REQUEST_FREQUENCY_PENALTY: kwargs.get(
-            "frequency_penalty",
-        ),
-        SpanAttributes.GEN_AI_REQUEST_STOP_SEQUENCES: kwargs.get(
-            "stop_sequences",
-        ),
-        SpanAttributes.GEN_AI_REQUEST_SEED: kwargs.get("seed"),
         # custom attributes
         SpanAttributes.AGENTSCOPE_FUNCTION_INPUT: _serialize_to_str(
             {
@@ -256,6 +266,37 @@ def _get_llm_request_attributes(
         ),
     }
 
+    # The conditionally required and recommended attributes are only
+    # recorded when a value is available
+    for key, value in (
+        (
+            SpanAttributes.GEN_AI_REQUEST_MODEL,
+            getattr(instance, "model_name", "unknown_model"),
+        ),
+        (
+            SpanAttributes.GEN_AI_REQUEST_TEMPERATURE,
+            kwargs.get("temperature"),
+        ),
+        (SpanAttributes.GEN_AI_REQUEST_TOP_P, top_p),
+        (SpanAttributes.GEN_AI_REQUEST_TOP_K, kwargs.get("top_k")),
+        (SpanAttributes.GEN_AI_REQUEST_MAX_TOKENS, kwargs.get("max_tokens")),
+        (
+            SpanAttributes.GEN_AI_REQUEST_PRESENCE_PENALTY,
+            kwargs.get("presence_penalty"),
+        ),
+        (
+            SpanAttributes.GEN_AI_REQUEST_FREQUENCY_PENALTY,
+            kwargs.get("frequency_penalty"),
+        ),
+        (
+            SpanAttributes.GEN_AI_REQUEST_STOP_SEQUENCES,
+            kwargs.get("stop_sequences"),
+        ),
+        (SpanAttributes.GEN_AI_REQUEST_SEED, kwargs.get("seed")),
+    ):
+        if value is not None:
+            attributes[key] = value
+
     # Extract tool definitions if provided
     tool_definitions = _get_tool_definitions(
         tools=kwargs.get("tools"),
@@ -264,7 +305,7 @@ def _get_llm_request_attributes(
     if tool_definitions:
         attributes[SpanAttributes.GEN_AI_TOOL_DEFINITIONS] = tool_definitions
 
-    return {k: v for k, v in attributes.items() if v is not None}
+    return attributes
 
 
 def _get_llm_span_name(attributes: Dict[str, str]) -> str:
@@ -312,13 +353,13 @@ def _get_llm_output_messages(
         if not isinstance(chat_response, ChatResponse):
             return chat_response
 
-        parts = []
         finish_reason = "stop"  # Default finish reason
 
-        for block in chat_response.content:
-            part = _convert_block_to_part(block)
-            if part:
-                parts.append(part)
+        parts = [
+            part
+            for part in map(_convert_block_to_part, chat_response.content)
+            if part
+        ]
 
         output_message = {
             "role": "assistant",
@@ -412,22 +453,22 @@ def _get_agent_messages(
         if isinstance(msg, Msg):
             msg = [msg]
 
-        formatted_msgs = []
-        for m in msg:
-            parts = []
-            for block in m.get_content_blocks():
-                part = _convert_block_to_part(block)
-                if part:
-                    parts.append(part)
-            formatted_msg = {
+        return [
+            {
                 "role": m.role,
-                "parts": parts,
+                "parts": [
+                    part
+                    for part in map(
+                        _convert_block_to_part,
+                        m.get_content_blocks(),
+                    )
+                    if part
+                ],
                 "name": m.name,
                 "finish_reason": "stop",
             }
-            formatted_msgs.append(formatted_msg)
-
-        return formatted_msgs
+            for m in msg
+        ]
     except Exception:
         return [
             {
@@ -444,6 +485,25 @@ def _get_agent_messages(
         ]
 
 
+@lru_cache(maxsize=128)
+def _get_agent_description(agent_class: type) -> str:
+    """Get the agent description from the docstring of the agent class.
+
+    The cleaned docstring only depends on the class, so it's computed once
+    per agent class instead of on every reply call.
+
+    Args:
+        agent_class (`type`):
+            The class of the agent instance.
+
+    Returns:
+        `str`:
+            The cleaned class docstring, or "No description available" if
+            the class has no docstring.
+    """
+    return inspect.getdoc(agent_class) or "No description available"
+
+
 def _get_agent_request_attributes(
     instance: "AgentBase",
     args: Tuple[Any, ...],
@@ -477,14 +537,13 @@ def _get_agent_request_attributes(
             "name",
             "unknown_agent",
         ),
-        SpanAttributes.GEN_AI_AGENT_DESCRIPTION: inspect.getdoc(
+        SpanAttributes.GEN_AI_AGENT_DESCRIPTION: _get_agent_description(
             instance.__class__,
-        )
-        or "No description available",
+        ),
     }
 
     msg = None
-    if args and len(args) > 0:
+    if args:
         msg = args[0]
     elif "msg" in kwargs:
         msg = kwargs["msg"]
@@ -834,14 +893,6 @@ def _get_embedding_request_attributes(
     """
     attributes = {
         SpanAttributes.GEN_AI_OPERATION_NAME: OperationNameValues.EMBEDDINGS,
-        SpanAttributes.GEN_AI_REQUEST_MODEL: getattr(
-            instance,
-            "model_name",
-            "unknown_model",
-        ),
-        SpanAttributes.GEN_AI_EMBEDDINGS_DIMENSION_COUNT: kwargs.get(
-            "dimensions",
-        ),
         SpanAttributes.AGENTSCOPE_FUNCTION_INPUT: _serialize_to_str(
             {
                 "args": args,
@@ -849,7 +900,18 @@ def _get_embedding_request_attributes(
             },
         ),
     }
-    return {k: v for k, v in attributes.items() if v is not None}
+
+    model_name = getattr(instance, "model_name", "unknown_model")
+    if model_name is not None:
+        attributes[SpanAttributes.GEN_AI_REQUEST_MODEL] = model_name
+
+    dimensions = kwargs.get("dimensions")
+    if dimensions is not None:
+        attributes[
+            SpanAttributes.GEN_AI_EMBEDDINGS_DIMENSION_COUNT
+        ] = dimensions
+
+    return attributes
 
 
 def _get_embedding_span_name(attributes: Dict[str, str]) -> str:
@@ -889,4 +951,4 @@ def _get_embedding_response_attributes(
     attributes = {
         SpanAttributes.AGENTSCOPE_FUNCTION_OUTPUT: _serialize_to_str(response),
     }
-    return {k: v for k, v in attributes.items() if v is not None}
+    return attributes
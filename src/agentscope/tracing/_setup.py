@@ -2,19 +2,63 @@
 """The tracing interface class in agentscope."""
 from typing import TYPE_CHECKING
 
+from .._logging import logger
+
 if TYPE_CHECKING:
     from opentelemetry.trace import Tracer
 else:
     Tracer = "Tracer"
 
+# The endpoints that already have a span processor attached, so that
+# repeated setup calls don't export the same spans more than once
+_CONFIGURED_ENDPOINTS: set[str] = set()
+
 
-def setup_tracing(endpoint: str) -> None:
+def setup_tracing(
+    endpoint: str,
+    max_queue_size: int | None = None,
+    schedule_delay_millis: float | None = None,
+    max_export_batch_size: int | None = None,
+) -> None:
     """Set up the AgentScope tracing by configuring the endpoint URL.
 
+    The spans are exported in batches by a background thread, so that the
+    export cost is kept off the agent execution path.
+
     Args:
         endpoint (`str`):
             The endpoint URL for the tracing exporter.
+        max_queue_size (`int | None`, optional):
+            The maximum number of spans buffered before new spans are
+            dropped. If not provided, the OpenTelemetry default (or the
+            `OTEL_BSP_MAX_QUEUE_SIZE` environment variable) is used.
+        schedule_delay_millis (`float | None`, optional):
+            The delay in milliseconds between two consecutive exports. If
+            not provided, the OpenTelemetry default (or the
+            `OTEL_BSP_SCHEDULE_DELAY` environment variable) is used.
+        max_export_batch_size (`int | None`, optional):
+            The maximum number of spans sent in one export request. If not
+            provided, the OpenTelemetry default (or the
+            `OTEL_BSP_MAX_EXPORT_BATCH_SIZE` environment variable) is used.
+
+    .. note::
+        Calling this function again with an endpoint that is already
+        configured has no effect, including on the `max_queue_size`,
+        `schedule_delay_millis` and `max_export_batch_size` settings.
     """
+    if endpoint in _CONFIGURED_ENDPOINTS:
+        if (
+            max_queue_size is not None
+            or schedule_delay_millis is not None
+            or max_export_batch_size is not None
+        ):
+            logger.warning(
+                "Tracing endpoint %s is already configured, the given "
+                "batch span processor settings are ignored.",
+                endpoint,
+            )
+        return
+
     # Lazy import
     from opentelemetry import trace
     from opentelemetry.sdk.trace import TracerProvider
@@ -25,7 +69,12 @@ def setup_tracing(endpoint: str) -> None:
 
     # Prepare a span_processor
     exporter = OTLPSpanExporter(endpoint=endpoint)
-    span_processor = BatchSpanProcessor(exporter)
+    span_processor = BatchSpanProcessor(
+        exporter,
+        max_queue_size=max_queue_size,
+        schedule_delay_millis=schedule_delay_millis,
+        max_export_batch_size=max_export_batch_size,
+    )
 
     tracer_provider: TracerProvider = trace.get_tracer_provider()
     if isinstance(tracer_provider, TracerProvider):
@@ -37,6 +86,8 @@ def setup_tracing(endpoint: str) -> None:
         tracer_provider.add_span_processor(span_processor)
         trace.set_tracer_provider(tracer_provider)
 
+    _CONFIGURED_ENDPOINTS.add(endpoint)
+
 
 def _get_tracer() -> Tracer:
     """Get the tracer
@@ -14,6 +14,7 @@ from typing import (
 )
 
 import aioitertools
+from opentelemetry.trace import StatusCode
 
 from .. import _config
 from ..embedding import EmbeddingModelBase, EmbeddingResponse
@@ -83,9 +84,7 @@ def _set_span_success_status(span: Span) -> None:
         span (`Span`):
             The OpenTelemetry span to be used for tracing.
     """
-    from opentelemetry import trace as trace_api
-
-    span.set_status(trace_api.StatusCode.OK)
+    span.set_status(StatusCode.OK)
     span.end()
 
 
@@ -97,9 +96,7 @@ def _set_span_error_status(span: Span, e: Exception) -> None:
         e (`Exception`):
             The exception to be recorded.
     """
-    from opentelemetry import trace as trace_api
-
-    span.set_status(trace_api.StatusCode.ERROR, str(e))
+    span.set_status(StatusCode.ERROR, str(e))
     span.record_exception(e)
     span.end()
 
@@ -163,20 +160,12 @@ async def _trace_async_generator_wrapper(
     finally:
         if not has_error:
             # Set the last chunk as output
-
-            if (
-                getattr(span, "attributes", {}).get(
-                    SpanAttributes.GEN_AI_OPERATION_NAME,
-                )
-                == OperationNameValues.CHAT
-            ):
+            operation_name = getattr(span, "attributes", {}).get(
+                SpanAttributes.GEN_AI_OPERATION_NAME,
+            )
+            if operation_name == OperationNameValues.CHAT:
                 response_attributes = _get_llm_response_attributes(last_chunk)
-            elif (
-                getattr(span, "attributes", {}).get(
-                    SpanAttributes.GEN_AI_OPERATION_NAME,
-                )
-                == OperationNameValues.EXECUTE_TOOL
-            ):
+            elif operation_name == OperationNameValues.EXECUTE_TOOL:
                 response_attributes = _get_tool_response_attributes(last_chunk)
             else:
                 response_attributes = (
@@ -342,13 +331,13 @@ def trace_toolkit(
         request_attributes = _get_tool_request_attributes(self, tool_call)
         span_name = _get_tool_span_name(request_attributes)
         function_name = f"{self.__class__.__name__}.{func.__name__}"
+        request_attributes.update(_get_common_attributes())
+        request_attributes[
+            SpanAttributes.AGENTSCOPE_FUNCTION_NAME
+        ] = function_name
         with tracer.start_as_current_span(
             name=span_name,
-            attributes={
-                **request_attributes,
-                **_get_common_attributes(),
-                SpanAttributes.AGENTSCOPE_FUNCTION_NAME: function_name,
-            },
+            attributes=request_attributes,
             end_on_exit=False,
         ) as span:
             try:
@@ -409,14 +398,14 @@ def trace_reply(
         request_attributes = _get_agent_request_attributes(self, args, kwargs)
         span_name = _get_agent_span_name(request_attributes)
         function_name = f"{self.__class__.__name__}.{func.__name__}"
+        request_attributes.update(_get_common_attributes())
+        request_attributes[
+            SpanAttributes.AGENTSCOPE_FUNCTION_NAME
+        ] = function_name
         # Begin the llm call span
         with tracer.start_as_current_span(
             name=span_name,
-            attributes={
-                **request_attributes,
-                **_get_common_attributes(),
-                SpanAttributes.AGENTSCOPE_FUNCTION_NAME: function_name,
-            },
+            attributes=request_attributes,
             end_on_exit=False,
         ) as span:
             try:
@@ -470,13 +459,13 @@ def trace_embedding(
         span_name = _get_embedding_span_name(request_attributes)
         function_name = f"{self.__class__.__name__}.{func.__name__}"
 
+        request_attributes.update(_get_common_attributes())
+        request_attributes[
+            SpanAttributes.AGENTSCOPE_FUNCTION_NAME
+        ] = function_name
         with tracer.start_as_current_span(
             name=span_name,
-            attributes={
-                **request_attributes,
-                **_get_common_attributes(),
-                SpanAttributes.AGENTSCOPE_FUNCTION_NAME: function_name,
-            },
+            attributes=request_attributes,
             end_on_exit=False,
         ) as span:
             try:
@@ -541,13 +530,13 @@ def trace_format(
         )
         span_name = _get_formatter_span_name(request_attributes)
         function_name = f"{self.__class__.__name__}.{func.__name__}"
+        request_attributes.update(_get_common_attributes())
+        request_attributes[
+            SpanAttributes.AGENTSCOPE_FUNCTION_NAME
+        ] = function_name
         with tracer.start_as_current_span(
             name=span_name,
-            attributes={
-                **request_attributes,
-                **_get_common_attributes(),
-                SpanAttributes.AGENTSCOPE_FUNCTION_NAME: function_name,
-            },
+            attributes=request_attributes,
             end_on_exit=False,
         ) as span:
             try:
@@ -618,14 +607,14 @@ def trace_llm(
         request_attributes = _get_llm_request_attributes(self, args, kwargs)
         span_name = _get_llm_span_name(request_attributes)
         function_name = f"{self.__class__.__name__}.__call__"
+        request_attributes.update(_get_common_attributes())
+        request_attributes[
+            SpanAttributes.AGENTSCOPE_FUNCTION_NAME
+        ] = function_name
         # Begin the llm call span
         with tracer.start_as_current_span(
             name=span_name,
-            attributes={
-                **request_attributes,
-                **_get_common_attributes(),
-                SpanAttributes.AGENTSCOPE_FUNCTION_NAME: function_name,
-            },
+            attributes=request_attributes,
             end_on_exit=False,
         ) as span:
             try:
@@ -11,6 +11,10 @@ from pydantic import BaseModel
 
 from ..message import Msg
 
+# `json.dumps` builds a new encoder for every call with non-default options,
+# so keep a single one for the per-span serialization
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
 
 def _to_serializable(
     obj: Any,
@@ -69,10 +73,7 @@ def _serialize_to_str(value: Any) -> str:
             JSON serialized string of the input value
     """
     try:
-        return json.dumps(value, ensure_ascii=False)
+        return _encode_json(value)
 
     except TypeError:
-        return json.dumps(
-            _to_serializable(value),
-            ensure_ascii=False,
-        )
+        return _encode_json(_to_serializable(value))
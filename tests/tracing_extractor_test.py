@@ -196,6 +196,19 @@ class ExtractorTest(TestCase):
         span_name = _get_llm_span_name(attributes)
         self.assertEqual(span_name, "chat test-model")
 
+        # Test zero-valued parameters are kept
+        attributes = _get_llm_request_attributes(
+            self.mock_model,
+            args,
+            {"p": 0.0, "top_p": 0.9, "temperature": 0},
+        )
+        self.assertEqual(attributes[SpanAttributes.GEN_AI_REQUEST_TOP_P], 0.0)
+        self.assertEqual(
+            attributes[SpanAttributes.GEN_AI_REQUEST_TEMPERATURE],
+            0,
+        )
+        self.assertNotIn(SpanAttributes.GEN_AI_REQUEST_TOP_K, attributes)
+
     def test_get_llm_response_attributes(self) -> None:
         """Test _get_llm_response_attributes and _get_llm_output_messages."""
         # Create a mock usage object
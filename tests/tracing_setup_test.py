@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the tracing setup module."""
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from agentscope.tracing import setup_tracing
+from agentscope.tracing._setup import _CONFIGURED_ENDPOINTS
+
+
+class SetupTest(TestCase):
+    """Test cases for the setup module."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.tracer_provider = Mock(spec=TracerProvider)
+
+    def tearDown(self) -> None:
+        """Clean up the configured endpoints."""
+        _CONFIGURED_ENDPOINTS.clear()
+
+    def test_setup_tracing_batch_span_processor(self) -> None:
+        """Test setup_tracing configures a batch span processor."""
+        with patch(
+            "opentelemetry.trace.get_tracer_provider",
+            return_value=self.tracer_provider,
+        ), patch(
+            "opentelemetry.sdk.trace.export.BatchSpanProcessor",
+        ) as mock_processor:
+            setup_tracing(
+                "http://localhost:4318/v1/traces",
+                max_queue_size=4096,
+                schedule_delay_millis=500,
+                max_export_batch_size=256,
+            )
+
+        _, kwargs = mock_processor.call_args
+        self.assertDictEqual(
+            kwargs,
+            {
+                "max_queue_size": 4096,
+                "schedule_delay_millis": 500,
+                "max_export_batch_size": 256,
+            },
+        )
+        self.tracer_provider.add_span_processor.assert_called_once_with(
+            mock_processor.return_value,
+        )
+
+    def test_setup_tracing_idempotent(self) -> None:
+        """Test repeated setup_tracing calls with the same endpoint."""
+        with patch(
+            "opentelemetry.trace.get_tracer_provider",
+            return_value=self.tracer_provider,
+        ):
+            setup_tracing("http://localhost:4318/v1/traces")
+            setup_tracing("http://localhost:4318/v1/traces")
+            self.assertEqual(
+                self.tracer_provider.add_span_processor.call_count,
+                1,
+            )
+
+            setup_tracing("http://localhost:6006/v1/traces")
+            self.assertEqual(
+                self.tracer_provider.add_span_processor.call_count,
+                2,
+            )
+
+            # Different processor settings for a configured endpoint are
+            # ignored with a warning
+            with self.assertLogs("as", level="WARNING"):
+                setup_tracing(
+                    "http://localhost:6006/v1/traces",
+                    max_queue_size=4096,
+                )
+            self.assertEqual(
+                self.tracer_provider.add_span_processor.call_count,
+                2,
+            )